@@ -1,13 +1,21 @@
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
-# Load environment variables from .env or config.env file if exists
-if os.path.exists('.env'):
-    load_dotenv('.env')
-elif os.path.exists('config.env'):
-    load_dotenv('config.env')
-else:
-    load_dotenv()  # Try default
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from .env or config.env file if exists (once per process)."""
+    if os.path.exists('.env'):
+        load_dotenv('.env')
+    elif os.path.exists('config.env'):
+        load_dotenv('config.env')
+    else:
+        load_dotenv()  # Try default
+
+
+_load_env()
 
 # Telegram Bot Configuration
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
@@ -20,33 +28,89 @@ STATS_LOGIN = os.getenv("STATS_LOGIN", "")
 STATS_PASSWORD = os.getenv("STATS_PASSWORD", "")
 
 # Schedule Configuration (hours when to send stats, default: midnight and noon)
-SCHEDULE_HOURS = [int(h) for h in os.getenv("SCHEDULE_HOURS", "0,12").split(",")]
+SCHEDULE_HOURS = tuple(int(h) for h in os.getenv("SCHEDULE_HOURS", "0,12").split(","))
+
+# Seconds a fetched report may be reused by on-demand requests (/stats, mentions); 0 = disabled
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "60"))
+
+# File with login session cookies of the HTTP session (written with 0600 permissions)
+SESSION_COOKIES_FILE = os.getenv("SESSION_COOKIES_FILE", "session_cookies.json")
+
+# Keep the fetched page HTML on StatsData.raw_html (debugging only)
+STORE_RAW_HTML = os.getenv("STORE_RAW_HTML", "false").lower() == "true"
+
+# Use headless Chrome instead of a plain HTTP session (fallback for JS-rendered pages)
+USE_SELENIUM = os.getenv("USE_SELENIUM", "false").lower() == "true"
 
 # Selenium Configuration for Railway (headless Chrome)
 SELENIUM_HEADLESS = os.getenv("SELENIUM_HEADLESS", "true").lower() == "true"
 CHROME_BIN = os.getenv("CHROME_BIN", "")  # Empty = use default
 CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "")  # Empty = use webdriver-manager
+# Persistent profile keeps cookies and HTTP cache between runs (Empty = fresh profile each time)
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", "/tmp/stats-chrome-profile")
+CHROME_CACHE_DIR = os.getenv("CHROME_CACHE_DIR", "/tmp/stats-chrome-cache")
 
 # Timezone for scheduler
 TIMEZONE = os.getenv("TIMEZONE", "Europe/Moscow")
 
 
+def _build_chrome_arguments() -> tuple:
+    """Build Chrome command line arguments from configuration."""
+    arguments = []
+    
+    if SELENIUM_HEADLESS:
+        arguments.append("--headless")
+    
+    # Required for running in containers
+    arguments += [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--window-size=1920,1080",
+        "--disable-extensions",
+        "--disable-infobars",
+        # Only the HTML is scraped, don't download or decode images
+        "--blink-settings=imagesEnabled=false",
+    ]
+    
+    # Reuse cookies and cached static assets between runs
+    if CHROME_PROFILE_DIR:
+        arguments.append(f"--user-data-dir={CHROME_PROFILE_DIR}")
+    if CHROME_CACHE_DIR:
+        arguments.append(f"--disk-cache-dir={CHROME_CACHE_DIR}")
+        arguments.append("--disk-cache-size=52428800")
+    
+    return tuple(arguments)
+
+
+# Chrome command line arguments, computed once per process
+_CHROME_ARGUMENTS = _build_chrome_arguments()
+
+# Content settings: block images, stylesheets, fonts and notifications (2 = block)
+_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
 def get_chrome_options():
-    """Get Chrome options configured for headless mode on Railway."""
+    """
+    Get Chrome options configured for headless mode on Railway.
+    Options objects are mutable, so a fresh one is built from the precomputed arguments on each call.
+    """
     from selenium.webdriver.chrome.options import Options
     
     options = Options()
     
-    if SELENIUM_HEADLESS:
-        options.add_argument("--headless")
+    for argument in _CHROME_ARGUMENTS:
+        options.add_argument(argument)
     
-    # Required for running in containers
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-infobars")
+    options.add_experimental_option("prefs", dict(_CHROME_PREFS))
+    
+    # Return from driver.get() on DOMContentLoaded instead of waiting for all resources
+    options.page_load_strategy = "eager"
     
     # Set Chrome binary location if specified
     if CHROME_BIN:
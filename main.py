@@ -10,7 +10,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 import config
-from scraper import fetch_statistics, format_stats_message
+from scraper import fetch_statistics_async, format_stats_message
 from storage import stats_to_dict, load_previous_stats, save_current_stats, get_diffs
 
 # Configure logging
@@ -21,13 +21,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def send_stats_to_telegram(bot: telegram.Bot, chat_id: str) -> bool:
+async def send_stats_to_telegram(bot: telegram.Bot, chat_id: str, ttl: float = config.STATS_CACHE_TTL) -> bool:
     """
     Fetch statistics and send them to Telegram chat.
     
     Args:
         bot: Telegram Bot instance
         chat_id: Target chat ID
+        ttl: Seconds a previously fetched report may be reused (0 = always fetch)
         
     Returns:
         True if message sent successfully, False otherwise
@@ -35,9 +36,7 @@ async def send_stats_to_telegram(bot: telegram.Bot, chat_id: str) -> bool:
     try:
         logger.info("Fetching statistics from website...")
         
-        # Fetch statistics (this is synchronous, run in executor)
-        loop = asyncio.get_event_loop()
-        stats_data = await loop.run_in_executor(None, fetch_statistics)
+        stats_data = await fetch_statistics_async(ttl)
         
         if stats_data.error:
             # Send error message
@@ -56,20 +55,20 @@ async def send_stats_to_telegram(bot: telegram.Bot, chat_id: str) -> bool:
         previous_stats = load_previous_stats()
         diffs = get_diffs(current_stats, previous_stats)
         
-        # Save current stats for next comparison
-        save_current_stats(current_stats)
-        
         # Format message with diffs
         message = format_stats_message(stats_data, diffs)
         
         logger.info(f"Sending message to chat {chat_id}")
         logger.debug(f"Message content: {message}")
         
-        # Send text message
-        await bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            parse_mode=ParseMode.HTML
+        # Send text message while saving current stats for next comparison (saves are serialized in storage)
+        await asyncio.gather(
+            bot.send_message(
+                chat_id=chat_id,
+                text=message,
+                parse_mode=ParseMode.HTML
+            ),
+            asyncio.to_thread(save_current_stats, current_stats)
         )
         
         logger.info("Message sent successfully!")
@@ -99,7 +98,7 @@ async def send_stats_to_telegram(bot: telegram.Bot, chat_id: str) -> bool:
 async def scheduled_job(bot: telegram.Bot, chat_id: str):
     """Job function to be called by scheduler."""
     logger.info(f"Running scheduled job at {datetime.now()}")
-    await send_stats_to_telegram(bot, chat_id)
+    await send_stats_to_telegram(bot, chat_id, ttl=0)
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1,23 +1,118 @@
+import asyncio
+import atexit
 import logging
+import re
+import threading
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass, field
+from urllib.parse import urljoin
 
+import httpx
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+import lxml.html
+from lxml import etree
 
 import config
+from storage import load_session_cookies, save_session_cookies, load_chromedriver_path, save_chromedriver_path
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chrome instance reused between runs, restarted after DRIVER_MAX_USES fetches
+DRIVER_MAX_USES = 20
+_driver_singleton: Optional[webdriver.Chrome] = None
+_driver_uses = 0
+_driver_lock = threading.Lock()
+# Thread quitting a retired WebDriver, see _shutdown_driver(background=True)
+_pending_quit: Optional[threading.Thread] = None
 
-@dataclass
+# Seconds between WebDriverWait condition checks (Selenium default is 0.5)
+_WAIT_POLL_INTERVAL = 0.2
+
+# Matches URLs of the login page (case-insensitive, no lowercased copy of the URL)
+_LOGIN_URL_RE = re.compile(r'login', re.IGNORECASE)
+
+# Fills the login form and submits it; returns false if the form is incomplete
+_LOGIN_SCRIPT = """
+const loginField = document.querySelector("input[type='text'], input[type='email']");
+const passwordField = document.querySelector("input[type='password']");
+if (!loginField || !passwordField) {
+    return false;
+}
+loginField.value = arguments[0];
+passwordField.value = arguments[1];
+const form = passwordField.form;
+const scope = form || document;
+const submitButton = scope.querySelector("button[type='submit']") || scope.querySelector("button");
+if (submitButton) {
+    submitButton.click();
+} else {
+    form.submit();
+}
+return true;
+"""
+
+# Last successful fetch as (time.monotonic() timestamp, StatsData), see fetch_statistics_async
+_last_stats: Optional[Tuple[float, "StatsData"]] = None
+
+# config.STATS_URL as compared by _is_stats_url
+_STATS_URL_NORMALIZED = config.STATS_URL.rstrip('/').lower()
+
+# Fetch in progress, awaited by every caller that misses the cache meanwhile
+_fetch_task: Optional[asyncio.Task] = None
+
+# Cookies of the HTTP session, shared between runs and persisted to disk
+_session_cookies: Optional[httpx.Cookies] = None
+# Cookies as last written to / read from disk, to skip rewriting an unchanged file
+_persisted_cookies: Optional[list] = None
+
+# Asset URL patterns blocked at the DevTools network layer
+_BLOCKED_URL_PATTERNS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico', '*.webp',
+    '*.woff', '*.woff2', '*.ttf',
+    '*googletagmanager*', '*google-analytics*', '*analytics*', '*mc.yandex*',
+)
+
+# Path resolved by webdriver-manager on first use
+_chromedriver_path: Optional[str] = None
+
+
+def _xpath_class(name: str) -> str:
+    """XPath predicate matching elements that have the given CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath expressions for the statistics page structure
+_TOP_LEVEL_CARD_PATH = f"//div[{_xpath_class('card')} and not(ancestor::div[{_xpath_class('card')}])]"
+# Header is a direct child, so the lookup never descends into nested cards
+_CARD_HEADER_PATH = f"./div[{_xpath_class('card-header')}]"
+
+# Compiled once at import, evaluated by calling them with an element
+# Top-level cards selected by header text (a P2P header wins over Posting)
+_P2P_CARDS = etree.XPath(f"{_TOP_LEVEL_CARD_PATH}[{_CARD_HEADER_PATH}[contains(., 'P2P')]]")
+_POSTING_CARDS = etree.XPath(
+    f"{_TOP_LEVEL_CARD_PATH}[{_CARD_HEADER_PATH}[contains(., 'Posting')] "
+    f"and not({_CARD_HEADER_PATH}[contains(., 'P2P')])]"
+)
+_CARD_BODY = etree.XPath(f".//div[{_xpath_class('card-body')}]")
+_LABEL = etree.XPath(".//label")
+_BADGE = etree.XPath(f".//span[{_xpath_class('badge')}]")
+_STAT_VALUE = etree.XPath(f".//div[{_xpath_class('fs-3')} or {_xpath_class('fw-bold')}]")
+_STAT_LABEL = etree.XPath(f".//div[{_xpath_class('text-muted')}]")
+_PASSWORD_INPUT = etree.XPath("//input[@type='password']")
+_NAMED_INPUTS = etree.XPath(".//input[@name]")
+
+# Nested stat cards inside the Posting Bot card: border class -> section name
+_NESTED_CARD_SECTIONS = {'border-primary': 'Посты', 'border-info': 'Сторис'}
+
+
+@dataclass(slots=True)
 class StatsBlock:
     """Represents a statistics block."""
     name: str
@@ -25,15 +120,39 @@ class StatsBlock:
     subsections: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsData:
     """Container for all statistics data."""
     p2p_bot: Optional[StatsBlock] = None
     posting_bot: Optional[StatsBlock] = None
-    raw_html: str = ""
+    raw_html: Optional[str] = None
     error: Optional[str] = None
 
 
+def _resolve_chromedriver_path(refresh: bool = False) -> str:
+    """
+    Return chromedriver path from webdriver-manager, cached in memory and on disk.
+    
+    Args:
+        refresh: Ignore cached path and ask webdriver-manager again
+        
+    Returns:
+        Path to chromedriver executable
+    """
+    global _chromedriver_path
+    
+    if not refresh:
+        if _chromedriver_path is None:
+            _chromedriver_path = load_chromedriver_path()
+        if _chromedriver_path:
+            return _chromedriver_path
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    _chromedriver_path = ChromeDriverManager().install()
+    save_chromedriver_path(_chromedriver_path)
+    return _chromedriver_path
+
+
 def create_driver() -> webdriver.Chrome:
     """Create and configure Chrome WebDriver."""
     options = config.get_chrome_options()
@@ -49,12 +168,17 @@ def create_driver() -> webdriver.Chrome:
         except Exception as e:
             logger.warning(f"Failed to use specified chromedriver path: {e}")
     
-    # Method 2: Try webdriver-manager
+    # Method 2: Try webdriver-manager (resolved path is cached between runs)
     if driver is None:
         try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            try:
+                service = Service(_resolve_chromedriver_path())
+                driver = webdriver.Chrome(service=service, options=options)
+            except Exception as e:
+                # Cached chromedriver may no longer match the installed Chrome
+                logger.warning(f"Cached chromedriver failed, resolving again: {e}")
+                service = Service(_resolve_chromedriver_path(refresh=True))
+                driver = webdriver.Chrome(service=service, options=options)
             logger.info("Using chromedriver from webdriver-manager")
         except Exception as e:
             logger.warning(f"Failed to use webdriver-manager: {e}")
@@ -69,9 +193,85 @@ def create_driver() -> webdriver.Chrome:
             raise
     
     driver.set_page_load_timeout(30)
+    # All waits are explicit WebDriverWait conditions with their own timeouts
+    driver.implicitly_wait(0)
+    
+    # Never request assets the scraper doesn't read
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_URL_PATTERNS)})
+    except Exception as e:
+        logger.warning(f"Failed to set blocked URLs: {e}")
+    
     return driver
 
 
+def get_driver() -> webdriver.Chrome:
+    """Return the cached WebDriver if it is still alive, otherwise create a new one."""
+    global _driver_singleton
+    
+    if _driver_singleton is not None:
+        try:
+            # Any WebDriver command fails if the browser session is gone
+            _driver_singleton.current_url
+            return _driver_singleton
+        except Exception as e:
+            logger.warning(f"Cached WebDriver is not responding, recreating: {e}")
+            _shutdown_driver()
+    
+    # A new Chrome can't open the persistent profile until the previous one has exited
+    _wait_pending_quit()
+    
+    logger.info("Creating WebDriver...")
+    _driver_singleton = create_driver()
+    return _driver_singleton
+
+
+def _quit_driver(driver: webdriver.Chrome):
+    """Quit a WebDriver, ignoring errors from an already dead browser."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+def _wait_pending_quit():
+    """Wait for a WebDriver being quit in the background to exit."""
+    global _pending_quit
+    
+    if _pending_quit is not None:
+        _pending_quit.join()
+        _pending_quit = None
+
+
+def _shutdown_driver(background: bool = False):
+    """
+    Quit the cached WebDriver and reset the usage counter.
+    
+    Args:
+        background: Quit in a separate thread so the caller doesn't wait for Chrome to exit
+    """
+    global _driver_singleton, _driver_uses, _pending_quit
+    
+    driver = _driver_singleton
+    _driver_singleton = None
+    _driver_uses = 0
+    
+    if driver is not None:
+        if background:
+            _wait_pending_quit()
+            _pending_quit = threading.Thread(target=_quit_driver, args=(driver,), daemon=True)
+            _pending_quit.start()
+        else:
+            _quit_driver(driver)
+    
+    if not background:
+        _wait_pending_quit()
+
+
+atexit.register(_shutdown_driver)
+
+
 def login(driver: webdriver.Chrome) -> bool:
     """
     Login to the statistics website.
@@ -87,17 +287,16 @@ def login(driver: webdriver.Chrome) -> bool:
         driver.get(config.STATS_URL)
         
         # Wait for page to load
-        wait = WebDriverWait(driver, 10)
+        wait = WebDriverWait(driver, 10, poll_frequency=_WAIT_POLL_INTERVAL)
         
         # Check if we're on login page (redirected)
-        current_url = driver.current_url.lower()
-        if 'login' not in current_url:
+        if not _LOGIN_URL_RE.search(driver.current_url):
             logger.info("Already logged in or no login required")
             return True
         
-        # Find login input field
+        # Wait for login input field
         try:
-            login_field = wait.until(
+            wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text'], input[type='email']"))
             )
             logger.info("Found login field")
@@ -105,57 +304,360 @@ def login(driver: webdriver.Chrome) -> bool:
             logger.error("Could not find login field")
             return False
         
-        # Find password field
-        try:
-            password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-            logger.info("Found password field")
-        except NoSuchElementException:
+        # Fill credentials and submit in a single WebDriver round-trip
+        submitted = driver.execute_script(_LOGIN_SCRIPT, config.STATS_LOGIN, config.STATS_PASSWORD)
+        if not submitted:
             logger.error("Could not find password field")
             return False
+        logger.info("Submitted login form")
         
-        # Enter credentials
-        login_field.clear()
-        login_field.send_keys(config.STATS_LOGIN)
+        # Wait until we leave the login page; if we never do, login failed
+        try:
+            WebDriverWait(driver, 15, poll_frequency=_WAIT_POLL_INTERVAL).until(lambda d: not _LOGIN_URL_RE.search(d.current_url))
+        except TimeoutException:
+            logger.error("Login failed - still on login page")
+            return False
+        
+        logger.info(f"Current URL after login: {driver.current_url}")
+        
+        return True
         
-        password_field.clear()
-        password_field.send_keys(config.STATS_PASSWORD)
+    except Exception as e:
+        logger.error(f"Login failed: {e}")
+        return False
+
+
+def _get_main_html(driver: webdriver.Chrome) -> str:
+    """
+    Get outer HTML of the <main> element instead of serializing the whole page.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        
+    Returns:
+        HTML of <main>, or of the whole document if there is no <main>
+    """
+    # One WebDriver round-trip, unlike DOM.getDocument + querySelector + getOuterHTML over DevTools
+    return driver.execute_script(
+        "const main = document.querySelector('main');"
+        "return (main || document.documentElement).outerHTML;"
+    )
+
+
+def _fetch_html_selenium() -> Optional[str]:
+    """
+    Fetch statistics page HTML using headless Chrome.
+    
+    Returns:
+        Page HTML or None if login failed
+    """
+    global _driver_uses
+    
+    with _driver_lock:
+        driver = get_driver()
         
-        # Find and click submit button
         try:
-            submit_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit'], button")
-            submit_button.click()
-            logger.info("Clicked submit button")
-        except NoSuchElementException:
-            # Try pressing Enter as fallback
-            password_field.submit()
-            logger.info("Submitted form via Enter key")
+            logger.info("Attempting login...")
+            if not login(driver):
+                return None
+            
+            # Wait for the metric badges the parser reads
+            try:
+                WebDriverWait(driver, 10, poll_frequency=_WAIT_POLL_INTERVAL).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.card .badge"))
+                )
+            except TimeoutException:
+                logger.warning("Statistics badges did not appear, parsing page as is")
+            
+            page_source = _get_main_html(driver)
+        except Exception:
+            # Don't reuse a browser left in an unknown state
+            _shutdown_driver()
+            raise
+        
+        _driver_uses += 1
+        if _driver_uses >= DRIVER_MAX_USES:
+            logger.info(f"WebDriver used {_driver_uses} times, restarting on next run")
+            _shutdown_driver(background=True)
+        
+        return page_source
+
+
+def _build_login_request(page_source: str, page_url: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Build login form submission from the login page HTML.
+    Hidden inputs (e.g. __RequestVerificationToken) are passed through as-is.
+    
+    Args:
+        page_source: HTML of the login page
+        page_url: URL the login page was served from
+        
+    Returns:
+        Tuple of (form action URL, form data) or None if no login form found
+    """
+    tree = lxml.html.fromstring(page_source)
+    
+    password_input = _first(tree, _PASSWORD_INPUT)
+    if password_input is None:
+        return None
+    
+    form = next(password_input.iterancestors('form'), None)
+    if form is None:
+        return None
+    
+    form_data = {}
+    for field_input in _NAMED_INPUTS(form):
+        name = field_input.get('name')
+        
+        input_type = (field_input.get('type') or 'text').lower()
+        if input_type == 'password':
+            form_data[name] = config.STATS_PASSWORD
+        elif input_type in ('text', 'email'):
+            form_data[name] = config.STATS_LOGIN
+        elif input_type in ('checkbox', 'radio'):
+            if 'checked' in field_input.attrib:
+                form_data[name] = field_input.get('value', 'on')
+        elif input_type not in ('submit', 'button', 'reset', 'image', 'file'):
+            form_data[name] = field_input.get('value', '')
+    
+    action_url = urljoin(page_url, form.get('action') or page_url)
+    return action_url, form_data
+
+
+def _get_session_cookies() -> httpx.Cookies:
+    """Return HTTP session cookies, loading them from disk on first use."""
+    global _session_cookies, _persisted_cookies
+    
+    if _session_cookies is None:
+        _persisted_cookies = load_session_cookies()
+        _session_cookies = httpx.Cookies()
+        for cookie in _persisted_cookies:
+            _session_cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+    
+    return _session_cookies
+
+
+async def _store_session_cookies(cookies: httpx.Cookies):
+    """Keep cookies of a successful session for the next run and persist them to disk if they changed."""
+    global _session_cookies, _persisted_cookies
+    
+    _session_cookies = cookies
+    cookie_list = [
+        {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+        for cookie in cookies.jar
+    ]
+    if cookie_list == _persisted_cookies:
+        return
+    
+    # Disk write runs in a worker thread to keep the event loop free
+    if await asyncio.to_thread(save_session_cookies, cookie_list):
+        _persisted_cookies = cookie_list
+
+
+def _is_stats_url(url: httpx.URL) -> bool:
+    """Return True if url points to the statistics page (query and trailing slash ignored)."""
+    return str(url.copy_with(query=None, fragment=None)).rstrip('/').lower() == _STATS_URL_NORMALIZED
+
+
+async def _fetch_html_http_async() -> Optional[str]:
+    """
+    Fetch statistics page HTML with an async HTTP session (no browser).
+    
+    Returns:
+        Page HTML or None if login failed
+    """
+    async with httpx.AsyncClient(cookies=_get_session_cookies(), follow_redirects=True, timeout=30) as client:
+        logger.info(f"Requesting {config.STATS_URL}")
+        response = await client.get(config.STATS_URL)
+        response.raise_for_status()
+        
+        # Not redirected to login page - session is already valid
+        if not _LOGIN_URL_RE.search(str(response.url)):
+            logger.info("Already logged in or no login required")
+            await _store_session_cookies(client.cookies)
+            return response.text
         
-        # Wait for page to load after login
-        time.sleep(3)
+        login_request = _build_login_request(response.text, str(response.url))
+        if login_request is None:
+            logger.error("Could not find login form")
+            return None
         
-        # Check if login was successful
-        current_url = driver.current_url
-        logger.info(f"Current URL after login: {current_url}")
+        action_url, form_data = login_request
+        logger.info(f"Submitting login form to {action_url}")
+        response = await client.post(action_url, data=form_data)
+        response.raise_for_status()
+        
+        # The POST usually redirects back to the stats page; only request it again if it didn't
+        if not _LOGIN_URL_RE.search(str(response.url)) and not _is_stats_url(response.url):
+            response = await client.get(config.STATS_URL)
+            response.raise_for_status()
+        logger.info(f"Current URL after login: {response.url}")
         
         # If still on login page, login failed
-        if 'login' in current_url.lower():
+        if _LOGIN_URL_RE.search(str(response.url)):
             logger.error("Login failed - still on login page")
-            return False
+            return None
         
-        return True
+        await _store_session_cookies(client.cookies)
+        return response.text
+
+
+def _text(element) -> str:
+    """Return element text with every text node stripped and joined without separator."""
+    # Leaf elements (labels, badges) hold all their text in .text, no need to walk the subtree
+    if len(element) == 0:
+        return (element.text or '').strip()
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def _first(element, xpath: etree.XPath):
+    """Return the first element matching compiled xpath or None."""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _collect_card_items(card_body) -> Tuple[list, list, Dict[str, list]]:
+    """
+    Walk a card body once and bucket the elements the parser needs.
+    Open nested stat cards are kept on a stack, so checking whether an element
+    is inside one does not re-ascend the tree.
+    
+    Args:
+        card_body: lxml element of the card body
         
-    except Exception as e:
-        logger.error(f"Login failed: {e}")
-        return False
+    Returns:
+        Tuple of (info-item divs, d-flex divs outside nested cards,
+        section name -> text-center stat boxes of that nested card)
+    """
+    info_items = []
+    flex_items = []
+    stat_boxes = {}
+    nested_cards = []  # Stack of (element, section name)
+    
+    for event, element in etree.iterwalk(card_body, events=('start', 'end')):
+        if element.tag != 'div':
+            continue
+        
+        if event == 'end':
+            if nested_cards and nested_cards[-1][0] is element:
+                nested_cards.pop()
+            continue
+        
+        classes = element.get('class', '').split()
+        
+        if 'card' in classes:
+            for border_class, section_name in _NESTED_CARD_SECTIONS.items():
+                if border_class in classes:
+                    nested_cards.append((element, section_name))
+                    stat_boxes.setdefault(section_name, [])
+                    break
+        
+        if 'info-item' in classes:
+            info_items.append(element)
+        
+        if nested_cards:
+            if 'text-center' in classes:
+                stat_boxes[nested_cards[-1][1]].append(element)
+        elif 'd-flex' in classes:
+            flex_items.append(element)
+    
+    return info_items, flex_items, stat_boxes
+
+
+def _parse_label_badges(items: list) -> Dict[str, str]:
+    """Parse label -> badge value pairs from metric rows."""
+    metrics = {}
+    for item in items:
+        label = _first(item, _LABEL)
+        badge = _first(item, _BADGE)
+        if label is not None and badge is not None:
+            key = _text(label).rstrip(':')
+            metrics[key] = _text(badge)
+    return metrics
+
+
+def _parse_stat_boxes(boxes: list, section_name: str) -> Dict[str, str]:
+    """
+    Parse stat boxes of a nested card (Posts / Stories) into label -> value pairs.
+    
+    Args:
+        boxes: text-center divs of the nested card
+        section_name: Section name used for logging
+        
+    Returns:
+        Dictionary with section metrics
+    """
+    section = {}
+    for box in boxes:
+        # Value is in div with fs-3 or fw-bold class
+        value_div = _first(box, _STAT_VALUE)
+        # Label is in div with text-muted class
+        label_div = _first(box, _STAT_LABEL)
+        if value_div is not None and label_div is not None:
+            value = _text(value_div)
+            label = _text(label_div)
+            section[label] = value
+            logger.info(f"{section_name}: {label} = {value}")
+    return section
+
+
+def _parse_p2p(card) -> Dict[str, str]:
+    """
+    Parse metrics of the P2P Bot card.
+    
+    Args:
+        card: lxml element of the top-level card
+        
+    Returns:
+        Dictionary with card metrics
+    """
+    card_body = _first(card, _CARD_BODY)
+    if card_body is None:
+        return {}
+    
+    info_items, flex_items, _ = _collect_card_items(card_body)
+    
+    # Method 1: info-item divs
+    # Method 2: Fall back to d-flex divs with label and badge
+    return _parse_label_badges(info_items) or _parse_label_badges(flex_items)
+
 
+def _parse_posting(card) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Parse general metrics and nested Posts/Stories cards of the Posting Bot card.
+    
+    Args:
+        card: lxml element of the top-level card
+        
+    Returns:
+        Tuple of (general metrics, subsections)
+    """
+    card_body = _first(card, _CARD_BODY)
+    if card_body is None:
+        return {}, {}
+    
+    _, flex_items, stat_boxes = _collect_card_items(card_body)
+    
+    # General statistics: d-flex divs with label and badge outside of nested cards
+    metrics = _parse_label_badges(flex_items)
+    
+    # Posts (border-primary) and Stories (border-info) nested cards
+    subsections = {}
+    for section_name in _NESTED_CARD_SECTIONS.values():
+        if section_name in stat_boxes:
+            logger.info(f"Found {section_name} card")
+            subsections[section_name] = _parse_stat_boxes(stat_boxes[section_name], section_name)
+    
+    return metrics, subsections
 
-def parse_statistics(driver: webdriver.Chrome) -> StatsData:
+
+def parse_statistics(page_source: str) -> StatsData:
     """
-    Parse statistics from the page after login.
+    Parse statistics from the page HTML after login.
     Based on the actual HTML structure of admin.doxmediagroup.com/Statistic
     
     Args:
-        driver: Selenium WebDriver instance
+        page_source: HTML of the statistics page
         
     Returns:
         StatsData object containing parsed statistics
@@ -163,115 +665,27 @@ def parse_statistics(driver: webdriver.Chrome) -> StatsData:
     stats_data = StatsData()
     
     try:
-        # Wait for page content to load
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "main")))
-        time.sleep(2)
+        # Keeping the whole page alive next to the parsed data is only useful for debugging
+        if config.STORE_RAW_HTML:
+            stats_data.raw_html = page_source
         
-        # Get page source
-        page_source = driver.page_source
-        stats_data.raw_html = page_source
-        
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(page_source, 'lxml')
+        tree = lxml.html.fromstring(page_source)
         
         # Initialize blocks
         p2p_block = StatsBlock(name="@P2PDox_bot")
         posting_block = StatsBlock(name="@Doxposting")
         
-        # Find all top-level cards (direct children of rows)
-        all_cards = soup.find_all('div', class_='card')
+        # P2P Bot card
+        for card in _P2P_CARDS(tree):
+            logger.info("Parsing P2P Bot card")
+            p2p_block.metrics.update(_parse_p2p(card))
         
-        for card in all_cards:
-            # Skip nested cards (those inside other cards)
-            parent_card = card.find_parent('div', class_='card')
-            if parent_card:
-                continue
-            
-            # Find card header
-            card_header = card.find('div', class_='card-header')
-            if not card_header:
-                continue
-            
-            header_text = card_header.get_text(strip=True)
-            
-            # P2P Bot card
-            if 'P2P' in header_text:
-                logger.info("Parsing P2P Bot card")
-                card_body = card.find('div', class_='card-body')
-                if card_body:
-                    # Method 1: Find all info-item divs
-                    info_items = card_body.find_all('div', class_='info-item')
-                    for item in info_items:
-                        label = item.find('label')
-                        badge = item.find('span', class_='badge')
-                        if label and badge:
-                            key = label.get_text(strip=True).rstrip(':')
-                            value = badge.get_text(strip=True)
-                            p2p_block.metrics[key] = value
-                    
-                    # Method 2: Find all d-flex divs with label and badge
-                    if not p2p_block.metrics:
-                        flex_items = card_body.find_all('div', class_='d-flex')
-                        for item in flex_items:
-                            label = item.find('label')
-                            badge = item.find('span', class_='badge')
-                            if label and badge:
-                                key = label.get_text(strip=True).rstrip(':')
-                                value = badge.get_text(strip=True)
-                                p2p_block.metrics[key] = value
-            
-            # Posting Bot card
-            elif 'Posting' in header_text:
-                logger.info("Parsing Posting Bot card")
-                card_body = card.find('div', class_='card-body')
-                if card_body:
-                    # Parse general statistics section
-                    # Look for all d-flex divs that contain label and badge
-                    all_flex_divs = card_body.find_all('div', class_='d-flex')
-                    for div in all_flex_divs:
-                        # Skip if inside nested card
-                        if div.find_parent('div', class_='card border-primary') or div.find_parent('div', class_='card border-info'):
-                            continue
-                        label = div.find('label')
-                        badge = div.find('span', class_='badge')
-                        if label and badge:
-                            key = label.get_text(strip=True).rstrip(':')
-                            value = badge.get_text(strip=True)
-                            posting_block.metrics[key] = value
-                    
-                    # Parse posts statistics card (nested card with border-primary)
-                    posts_card = card_body.find('div', class_=lambda x: x and 'border-primary' in x)
-                    if posts_card:
-                        posting_block.subsections['Посты'] = {}
-                        logger.info("Found posts card")
-                        # Find all stat boxes with text-center class
-                        stat_boxes = posts_card.find_all('div', class_='text-center')
-                        for box in stat_boxes:
-                            # Value is in div with fs-3 or fw-bold class
-                            value_div = box.find('div', class_=lambda x: x and ('fs-3' in x or 'fw-bold' in x))
-                            # Label is in div with text-muted class
-                            label_div = box.find('div', class_='text-muted')
-                            if value_div and label_div:
-                                value = value_div.get_text(strip=True)
-                                label = label_div.get_text(strip=True)
-                                posting_block.subsections['Посты'][label] = value
-                                logger.info(f"Posts: {label} = {value}")
-                    
-                    # Parse stories statistics card (nested card with border-info)
-                    stories_card = card_body.find('div', class_=lambda x: x and 'border-info' in x)
-                    if stories_card:
-                        posting_block.subsections['Сторис'] = {}
-                        logger.info("Found stories card")
-                        stat_boxes = stories_card.find_all('div', class_='text-center')
-                        for box in stat_boxes:
-                            value_div = box.find('div', class_=lambda x: x and ('fs-3' in x or 'fw-bold' in x))
-                            label_div = box.find('div', class_='text-muted')
-                            if value_div and label_div:
-                                value = value_div.get_text(strip=True)
-                                label = label_div.get_text(strip=True)
-                                posting_block.subsections['Сторис'][label] = value
-                                logger.info(f"Stories: {label} = {value}")
+        # Posting Bot card
+        for card in _POSTING_CARDS(tree):
+            logger.info("Parsing Posting Bot card")
+            metrics, subsections = _parse_posting(card)
+            posting_block.metrics.update(metrics)
+            posting_block.subsections.update(subsections)
         
         # Assign blocks
         if p2p_block.metrics:
@@ -295,37 +709,127 @@ def parse_statistics(driver: webdriver.Chrome) -> StatsData:
     return stats_data
 
 
-def fetch_statistics() -> StatsData:
+def _get_cached_stats(ttl: float) -> Optional[StatsData]:
+    """Return the last successfully fetched statistics if younger than ttl seconds."""
+    if _last_stats is not None and ttl > 0:
+        fetched_at, stats_data = _last_stats
+        if time.monotonic() - fetched_at < ttl:
+            logger.info("Using cached statistics")
+            return stats_data
+    return None
+
+
+def _remember_stats(stats_data: StatsData):
+    """Store successfully fetched statistics for reuse by _get_cached_stats."""
+    global _last_stats
+    
+    if not stats_data.error:
+        _last_stats = (time.monotonic(), stats_data)
+
+
+async def _fetch_statistics() -> StatsData:
     """
-    Main function to fetch statistics from the website.
+    Fetch and parse statistics, see fetch_statistics_async.
+    The HTTP session runs natively on asyncio; Selenium and HTML parsing run in a worker thread.
     
     Returns:
         StatsData object with parsed statistics or error
     """
-    driver = None
     try:
-        logger.info("Creating WebDriver...")
-        driver = create_driver()
+        if config.USE_SELENIUM:
+            logger.info("Fetching statistics via Selenium...")
+            page_source = await asyncio.to_thread(_fetch_html_selenium)
+        else:
+            logger.info("Fetching statistics via async HTTP session...")
+            page_source = await _fetch_html_http_async()
         
-        logger.info("Attempting login...")
-        if not login(driver):
+        if page_source is None:
             return StatsData(error="Login failed")
         
         logger.info("Parsing statistics...")
-        stats_data = parse_statistics(driver)
+        stats_data = await asyncio.to_thread(parse_statistics, page_source)
+        _remember_stats(stats_data)
         
         return stats_data
         
     except Exception as e:
         logger.error(f"Failed to fetch statistics: {e}")
         return StatsData(error=str(e))
+
+
+def _clear_fetch_task(task: asyncio.Task):
+    """Forget the finished fetch so the next cache miss starts a new one."""
+    global _fetch_task
+    
+    if _fetch_task is task:
+        _fetch_task = None
+
+
+async def fetch_statistics_async(ttl: float = config.STATS_CACHE_TTL) -> StatsData:
+    """
+    Main function to fetch statistics from the website without blocking the event loop.
+    Callers arriving while a fetch is in progress await that fetch instead of starting another one.
+    
+    Args:
+        ttl: Seconds a previous successful result may be reused (0 = always fetch)
+    
+    Returns:
+        StatsData object with parsed statistics or error
+    """
+    global _fetch_task
+    
+    cached = _get_cached_stats(ttl)
+    if cached is not None:
+        return cached
+    
+    if _fetch_task is None:
+        _fetch_task = asyncio.create_task(_fetch_statistics())
+        _fetch_task.add_done_callback(_clear_fetch_task)
+    else:
+        logger.info("Waiting for statistics fetch already in progress")
+    
+    # Shielded so a cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(_fetch_task)
+
+
+def _report_footer() -> str:
+    """Return the #Report line with current date and time (Moscow time)."""
+    from datetime import datetime
+    import pytz
+    
+    moscow_tz = pytz.timezone('Europe/Moscow')
+    now = datetime.now(moscow_tz)
+    date_str = now.strftime("%d.%m.%Y")
+    time_str = now.strftime("%H:%M")
+    return f"#Report | {date_str} | {time_str}"
+
+
+def _iter_blocks(stats_data: StatsData, diffs: Dict):
+    """Yield (title, metrics, block diffs) for every block of the message."""
+    # P2P Bot (p2pDox) block
+    if stats_data.p2p_bot:
+        yield stats_data.p2p_bot.name, stats_data.p2p_bot.metrics, diffs.get('p2p_bot', {})
+    
+    # Posting Bot (Doxposting) block
+    if stats_data.posting_bot:
+        # Main metrics (general stats)
+        yield stats_data.posting_bot.name, stats_data.posting_bot.metrics, diffs.get('posting_bot', {})
         
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
+        # Subsections as separate blocks (Posts, Stories)
+        for section_name, section_metrics in stats_data.posting_bot.subsections.items():
+            if section_metrics:
+                yield section_name, section_metrics, diffs.get('subsections', {}).get(section_name, {})
+
+
+def _iter_message_lines(stats_data: StatsData, diffs: Dict):
+    """Yield message lines, blocks separated by an empty line."""
+    for index, (title, metrics, block_diffs) in enumerate(_iter_blocks(stats_data, diffs)):
+        if index:
+            yield ""
+        yield f"<b>{title}</b>"
+        for key, value in metrics.items():
+            diff = block_diffs.get(key)
+            yield f"<b>{key}</b>: {value} ({diff})" if diff else f"<b>{key}</b>: {value}"
 
 
 def format_stats_message(stats_data: StatsData, diffs: Optional[Dict] = None) -> str:
@@ -341,81 +845,22 @@ def format_stats_message(stats_data: StatsData, diffs: Optional[Dict] = None) ->
         HTML formatted message string
     """
     if stats_data.error:
-        from datetime import datetime
-        import pytz
-        moscow_tz = pytz.timezone('Europe/Moscow')
-        now = datetime.now(moscow_tz)
-        date_str = now.strftime("%d.%m.%Y")
-        time_str = now.strftime("%H:%M")
-        return f"<b>Ошибка получения статистики</b>: {stats_data.error}\n\n#Report | {date_str} | {time_str}"
+        return f"<b>Ошибка получения статистики</b>: {stats_data.error}\n\n{_report_footer()}"
     
     if diffs is None:
         diffs = {'p2p_bot': {}, 'posting_bot': {}, 'subsections': {}}
     
-    message_parts = []
-    
-    # Format P2P Bot (p2pDox) block
-    if stats_data.p2p_bot:
-        block_lines = [f"<b>{stats_data.p2p_bot.name}</b>"]
-        for key, value in stats_data.p2p_bot.metrics.items():
-            diff = diffs.get('p2p_bot', {}).get(key, '')
-            if diff:
-                block_lines.append(f"<b>{key}</b>: {value} ({diff})")
-            else:
-                block_lines.append(f"<b>{key}</b>: {value}")
-        message_parts.append('\n'.join(block_lines))
-    
-    # Format Posting Bot (Doxposting) block
-    if stats_data.posting_bot:
-        # Main metrics (general stats)
-        block_lines = [f"<b>{stats_data.posting_bot.name}</b>"]
-        for key, value in stats_data.posting_bot.metrics.items():
-            diff = diffs.get('posting_bot', {}).get(key, '')
-            if diff:
-                block_lines.append(f"<b>{key}</b>: {value} ({diff})")
-            else:
-                block_lines.append(f"<b>{key}</b>: {value}")
-        message_parts.append('\n'.join(block_lines))
-        
-        # Subsections as separate blocks (Posts, Stories)
-        for section_name, section_metrics in stats_data.posting_bot.subsections.items():
-            if section_metrics:
-                section_lines = [f"<b>{section_name}</b>"]
-                section_diffs = diffs.get('subsections', {}).get(section_name, {})
-                for key, value in section_metrics.items():
-                    diff = section_diffs.get(key, '')
-                    if diff:
-                        section_lines.append(f"<b>{key}</b>: {value} ({diff})")
-                    else:
-                        section_lines.append(f"<b>{key}</b>: {value}")
-                message_parts.append('\n'.join(section_lines))
-    
-    if not message_parts:
-        from datetime import datetime
-        import pytz
-        moscow_tz = pytz.timezone('Europe/Moscow')
-        now = datetime.now(moscow_tz)
-        date_str = now.strftime("%d.%m.%Y")
-        time_str = now.strftime("%H:%M")
-        return f"<b>Статистика</b>: данные не найдены\n\n#Report | {date_str} | {time_str}"
-    
-    # Join all parts and add #Report with date/time at the end (Moscow time)
-    from datetime import datetime
-    import pytz
-    
-    moscow_tz = pytz.timezone('Europe/Moscow')
-    now = datetime.now(moscow_tz)
-    date_str = now.strftime("%d.%m.%Y")
-    time_str = now.strftime("%H:%M")
+    body = '\n'.join(_iter_message_lines(stats_data, diffs))
     
-    result = '\n\n'.join(message_parts)
-    result += f"\n\n#Report | {date_str} | {time_str}"
+    if not body:
+        return f"<b>Статистика</b>: данные не найдены\n\n{_report_footer()}"
     
-    return result
+    # Add #Report with date/time at the end (Moscow time)
+    return f"{body}\n\n{_report_footer()}"
 
 
 if __name__ == "__main__":
     # Test the scraper
     print("Testing scraper...")
-    stats = fetch_statistics()
+    stats = asyncio.run(fetch_statistics_async())
     print(format_stats_message(stats))
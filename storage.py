@@ -1,28 +1,83 @@
 import json
 import os
 import logging
+import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any
+
+import config
 
 logger = logging.getLogger(__name__)
 
 # File to store previous statistics
 STATS_FILE = "stats_history.json"
 
+# File to store login session cookies of the statistics website
+COOKIES_FILE = config.SESSION_COOKIES_FILE
+
+# File to cache chromedriver path resolved by webdriver-manager
+CHROMEDRIVER_PATH_FILE = os.path.expanduser("~/.cache/stats-tracker/chromedriver_path")
+
+# Ask webdriver-manager again once the cached path is older than a week
+CHROMEDRIVER_PATH_MAX_AGE = 7 * 24 * 3600
+
+# Russian number format -> float() compatible string
+_NUMBER_TRANSLATION = str.maketrans({',': '.', ' ': None, '\xa0': None})
+
+# Serializes _write_json_atomic (saves run in worker threads)
+_write_lock = threading.Lock()
+
+# In-memory copy of the last saved/loaded statistics
+_cached_prev: Optional[Dict[str, Any]] = None
+
+
+def _write_json_atomic(path: str, data: Any, mode: int = 0o644):
+    """
+    Write JSON to a temporary file and move it over path.
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    Every write gets its own temporary file and writes are serialized, so concurrent saves can't clash.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+        mode: Permission bits of the written file
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    
+    with _write_lock:
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{filename}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
 
 def load_previous_stats() -> Optional[Dict[str, Any]]:
     """
     Load previous statistics from JSON file.
+    The file is only read once per process, later calls return the in-memory copy.
     
     Returns:
         Dictionary with previous stats or None if file doesn't exist
     """
+    global _cached_prev
+    
+    if _cached_prev is not None:
+        return _cached_prev
+    
     try:
         if os.path.exists(STATS_FILE):
             with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                _cached_prev = json.load(f)
                 logger.info(f"Loaded previous stats from {STATS_FILE}")
-                return data
+                return _cached_prev
         else:
             logger.info("No previous stats file found")
             return None
@@ -33,7 +88,7 @@ def load_previous_stats() -> Optional[Dict[str, Any]]:
 
 def save_current_stats(stats_data: Dict[str, Any]) -> bool:
     """
-    Save current statistics to JSON file.
+    Save current statistics to JSON file and keep them as the in-memory previous stats.
     
     Args:
         stats_data: Dictionary with current statistics
@@ -41,12 +96,15 @@ def save_current_stats(stats_data: Dict[str, Any]) -> bool:
     Returns:
         True if saved successfully, False otherwise
     """
+    global _cached_prev
+    
     try:
         # Add timestamp
         stats_data['timestamp'] = datetime.now().isoformat()
         
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(stats_data, f, ensure_ascii=False, indent=2)
+        _write_json_atomic(STATS_FILE, stats_data)
+        
+        _cached_prev = stats_data
         
         logger.info(f"Saved current stats to {STATS_FILE}")
         return True
@@ -55,6 +113,87 @@ def save_current_stats(stats_data: Dict[str, Any]) -> bool:
         return False
 
 
+def load_session_cookies() -> List[Dict[str, str]]:
+    """
+    Load saved login session cookies from JSON file.
+    
+    Returns:
+        List of cookie dictionaries (name, value, domain, path) or empty list
+    """
+    try:
+        if os.path.exists(COOKIES_FILE):
+            with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+                logger.info(f"Loaded session cookies from {COOKIES_FILE}")
+                return cookies
+        return []
+    except Exception as e:
+        logger.error(f"Failed to load session cookies: {e}")
+        return []
+
+
+def save_session_cookies(cookies: List[Dict[str, str]]) -> bool:
+    """
+    Save login session cookies to JSON file.
+    
+    Args:
+        cookies: List of cookie dictionaries (name, value, domain, path)
+        
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    try:
+        # Live session credentials: readable by the owner only
+        _write_json_atomic(COOKIES_FILE, cookies, mode=0o600)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save session cookies: {e}")
+        return False
+
+
+def load_chromedriver_path() -> Optional[str]:
+    """
+    Load cached chromedriver path.
+    
+    Returns:
+        Path to chromedriver or None if not cached, stale or the file is gone
+    """
+    try:
+        if os.path.exists(CHROMEDRIVER_PATH_FILE):
+            if time.time() - os.path.getmtime(CHROMEDRIVER_PATH_FILE) > CHROMEDRIVER_PATH_MAX_AGE:
+                logger.info("Cached chromedriver path is older than a week, refreshing")
+                return None
+            with open(CHROMEDRIVER_PATH_FILE, 'r', encoding='utf-8') as f:
+                path = f.read().strip()
+            if path and os.path.exists(path):
+                logger.info(f"Using cached chromedriver path {path}")
+                return path
+        return None
+    except Exception as e:
+        logger.error(f"Failed to load chromedriver path: {e}")
+        return None
+
+
+def save_chromedriver_path(path: str) -> bool:
+    """
+    Cache chromedriver path for next process start.
+    
+    Args:
+        path: Path to chromedriver executable
+        
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_PATH_FILE), exist_ok=True)
+        with open(CHROMEDRIVER_PATH_FILE, 'w', encoding='utf-8') as f:
+            f.write(path)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save chromedriver path: {e}")
+        return False
+
+
 def stats_to_dict(stats_data) -> Dict[str, Any]:
     """
     Convert StatsData object to dictionary for storage.
@@ -63,29 +202,31 @@ def stats_to_dict(stats_data) -> Dict[str, Any]:
         stats_data: StatsData object
         
     Returns:
-        Dictionary representation of stats
+        Dictionary representation of stats (shares the metric dicts, nothing mutates them)
     """
     result = {}
     
     if stats_data.p2p_bot:
         result['p2p_bot'] = {
             'name': stats_data.p2p_bot.name,
-            'metrics': stats_data.p2p_bot.metrics.copy()
+            'metrics': stats_data.p2p_bot.metrics
         }
     
     if stats_data.posting_bot:
         result['posting_bot'] = {
             'name': stats_data.posting_bot.name,
-            'metrics': stats_data.posting_bot.metrics.copy(),
-            'subsections': {k: v.copy() for k, v in stats_data.posting_bot.subsections.items()}
+            'metrics': stats_data.posting_bot.metrics,
+            'subsections': stats_data.posting_bot.subsections
         }
     
     return result
 
 
+@lru_cache(maxsize=4096)
 def parse_number(value: str) -> Optional[float]:
     """
     Parse a number from string, handling Russian number format.
+    Results are memoized: the same metric strings recur across runs.
     
     Args:
         value: String value like "2861" or "1,83"
@@ -94,8 +235,8 @@ def parse_number(value: str) -> Optional[float]:
         Float value or None if parsing failed
     """
     try:
-        # Replace Russian decimal comma with dot
-        cleaned = value.replace(',', '.').replace(' ', '').replace('\xa0', '')
+        # Replace Russian decimal comma with dot, drop (non-breaking) spaces
+        cleaned = value.translate(_NUMBER_TRANSLATION)
         return float(cleaned)
     except (ValueError, AttributeError):
         return None
@@ -135,9 +276,38 @@ def calculate_diff(current_value: str, previous_value: str) -> Optional[str]:
             return f"{diff:.2f}".replace('.', ',')
 
 
+def _flatten_metrics(stats: Dict[str, Any]) -> Dict[Tuple[str, Optional[str], str], str]:
+    """
+    Flatten statistics into {(block, section, metric): value}.
+    Section is None for the main metrics of a block.
+    
+    Args:
+        stats: Statistics dictionary as produced by stats_to_dict
+        
+    Returns:
+        Flat dictionary of metric values
+    """
+    flat = {}
+    
+    for block in ('p2p_bot', 'posting_bot'):
+        block_stats = stats.get(block)
+        if not block_stats:
+            continue
+        
+        for key, value in block_stats.get('metrics', {}).items():
+            flat[(block, None, key)] = value
+        
+        for section_name, section in block_stats.get('subsections', {}).items():
+            for key, value in section.items():
+                flat[(block, section_name, key)] = value
+    
+    return flat
+
+
 def get_diffs(current_stats: Dict[str, Any], previous_stats: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
     """
     Calculate differences between current and previous statistics.
+    Both sides are flattened once, so every metric costs a single key lookup.
     
     Args:
         current_stats: Current statistics dictionary
@@ -155,41 +325,19 @@ def get_diffs(current_stats: Dict[str, Any], previous_stats: Optional[Dict[str,
     if not previous_stats:
         return diffs
     
-    # P2P Bot differences
-    if 'p2p_bot' in current_stats and 'p2p_bot' in previous_stats:
-        current_metrics = current_stats['p2p_bot'].get('metrics', {})
-        previous_metrics = previous_stats['p2p_bot'].get('metrics', {})
-        
-        for key, current_value in current_metrics.items():
-            if key in previous_metrics:
-                diff = calculate_diff(current_value, previous_metrics[key])
-                if diff:
-                    diffs['p2p_bot'][key] = diff
-    
-    # Posting Bot differences
-    if 'posting_bot' in current_stats and 'posting_bot' in previous_stats:
-        current_metrics = current_stats['posting_bot'].get('metrics', {})
-        previous_metrics = previous_stats['posting_bot'].get('metrics', {})
-        
-        for key, current_value in current_metrics.items():
-            if key in previous_metrics:
-                diff = calculate_diff(current_value, previous_metrics[key])
-                if diff:
-                    diffs['posting_bot'][key] = diff
-        
-        # Subsections differences
-        current_subsections = current_stats['posting_bot'].get('subsections', {})
-        previous_subsections = previous_stats['posting_bot'].get('subsections', {})
+    previous_flat = _flatten_metrics(previous_stats)
+    
+    for (block, section_name, key), current_value in _flatten_metrics(current_stats).items():
+        previous_value = previous_flat.get((block, section_name, key))
+        if previous_value is None:
+            continue
         
-        for section_name, current_section in current_subsections.items():
-            if section_name in previous_subsections:
-                diffs['subsections'][section_name] = {}
-                previous_section = previous_subsections[section_name]
-                
-                for key, current_value in current_section.items():
-                    if key in previous_section:
-                        diff = calculate_diff(current_value, previous_section[key])
-                        if diff:
-                            diffs['subsections'][section_name][key] = diff
+        diff = calculate_diff(current_value, previous_value)
+        if diff:
+            if section_name is None:
+                diffs[block][key] = diff
+            else:
+                # Subsection diffs are grouped by section name only, as the message formatter expects
+                diffs['subsections'].setdefault(section_name, {})[key] = diff
     
     return diffs